@@ -0,0 +1,176 @@
+"""
+Консольная сортировка транзакций из JSONL/CSV файлов и пайпов
+
+Примеры запуска:
+    python sort_cli.py transactions.jsonl
+    cat transactions.csv | python sort_cli.py --input-format csv --top 10
+    python sort_cli.py feed.jsonl --current-date 2026-02-11T15:30 --output-format jsonl
+
+Вход читается за один проход через io.TextIOWrapper, записи разбираются по
+мере чтения. Без --top все записи загружаются в память и сортируются
+sorted(); с --top они обрабатываются потоково через heapq.nlargest, и в
+памяти остаются только N лучших. Отдельные потоки для стадий не
+используются: разбор JSON и времени упирается в процессор, и под GIL потоки
+лишь добавляли расходы на передачу пачек через очереди.
+"""
+
+import argparse
+import codecs
+import csv
+import functools
+import heapq
+import io
+import itertools
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from task import reference_date, transaction_sort_key
+
+INPUT_FORMATS = ("auto", "jsonl", "csv")
+OUTPUT_FORMATS = ("operations", "jsonl", "csv")
+RECORD_FIELDS = ("operation", "time")
+
+
+def _parse_jsonl(lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"строка {line_no}: некорректный JSON: {error.msg}") from None
+        if not isinstance(record, dict):
+            raise ValueError(f"строка {line_no}: ожидался объект, получен {type(record).__name__}")
+        missing = [field for field in RECORD_FIELDS if field not in record]
+        if missing:
+            raise ValueError(f"строка {line_no}: нет полей: {', '.join(missing)}")
+        yield record
+
+
+def _parse_csv(lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+    reader = csv.DictReader(lines)
+    missing = [field for field in RECORD_FIELDS if field not in (reader.fieldnames or ())]
+    if missing:
+        raise ValueError(f"в заголовке CSV нет столбцов: {', '.join(missing)}")
+    for record in reader:
+        # DictReader складывает лишние ячейки под ключ None, а недостающие заполняет None
+        if None in record or None in record.values():
+            raise ValueError(f"строка {reader.line_num}: число ячеек не совпадает с заголовком "
+                             f"(столбцов в заголовке: {len(reader.fieldnames)})")
+        yield record
+
+
+def _detect_format(path: str) -> str:
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def sort_records(records: Iterable[Dict[str, str]], now: datetime = reference_date,
+                 top: Optional[int] = None) -> List[Dict[str, str]]:
+    """
+    Сортирует записи от новых к старым.
+
+    Args:
+        records: Записи с ключами 'operation' и 'time'
+        now: Дата, которая считается "сегодня"
+        top: Если задано, возвращаются только top самых новых записей
+
+    Returns:
+        Отсортированный список записей
+    """
+    key = functools.partial(transaction_sort_key, now=now)
+    # И sorted(reverse=True), и nlargest сохраняют исходный порядок записей с одинаковым временем
+    if top is not None:
+        return heapq.nlargest(top, records, key=key)
+    return sorted(records, key=key, reverse=True)
+
+
+def _write_records(records: Iterable[Dict[str, str]], output_format: str, stream: io.BufferedIOBase) -> None:
+    """Выводит записи в stream в выбранном формате"""
+    out = codecs.getwriter("utf-8")(stream)
+    if output_format == "csv":
+        writer = csv.DictWriter(out, fieldnames=RECORD_FIELDS, extrasaction="ignore", lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(records)
+    elif output_format == "jsonl":
+        for record in records:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    else:
+        for record in records:
+            out.write(f"{record['operation']}\n")
+    stream.flush()
+
+
+def _parse_current_date(value: str) -> datetime:
+    """Разбирает --current-date; дата со смещением UTC отвергается, так как даты транзакций наивные"""
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"некорректная дата в ISO формате: {value!r}") from None
+    if moment.tzinfo is not None:
+        raise argparse.ArgumentTypeError(f"дата не должна содержать часовой пояс: {value!r}")
+    return moment
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Сортировка транзакций от новых к старым")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="JSONL или CSV файл с полями operation и time ('-' — stdin)")
+    parser.add_argument("--input-format", choices=INPUT_FORMATS, default="auto",
+                        help="формат входных данных (auto — по расширению файла, stdin читается как JSONL)")
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, default="operations",
+                        help="operations — только названия операций, jsonl/csv — записи целиком")
+    parser.add_argument("--current-date", type=_parse_current_date, default=reference_date,
+                        help="дата, которая считается \"сегодня\", в ISO формате без часового пояса "
+                             f"(по умолчанию {reference_date:%Y-%m-%dT%H:%M})")
+    parser.add_argument("--top", type=int, default=None, help="вывести только N самых новых записей")
+    args = parser.parse_args(argv)
+    if args.top is not None and args.top < 1:
+        parser.error("--top должен быть положительным")
+    if args.input_format == "auto":
+        args.input_format = _detect_format(args.input)
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    started = time.perf_counter()
+    try:
+        stream = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    except OSError as error:
+        print(f"sort_cli: ошибка: {error}", file=sys.stderr)
+        return 1
+
+    counter = itertools.count()
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        parse = _parse_csv if args.input_format == "csv" else _parse_jsonl
+        records = (record for record, _ in zip(parse(text), counter))
+        ordered = sort_records(records, args.current_date, args.top)
+        _write_records(ordered, args.output_format, sys.stdout.buffer)
+    except BrokenPipeError:
+        # Получатель закрыл канал раньше времени (например, `| head`): для фильтра это нормально.
+        # stdout перенаправляется в devnull, чтобы сброс буфера при выходе не вызвал ошибку повторно.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (OSError, UnicodeDecodeError, ValueError) as error:
+        print(f"sort_cli: ошибка: {error}", file=sys.stderr)
+        return 1
+    finally:
+        if stream is sys.stdin.buffer:
+            text.detach()
+        else:
+            text.close()
+
+    rows = next(counter)
+    elapsed = time.perf_counter() - started
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    print(f"sort_cli: {rows} записей за {elapsed:.3f} с ({rate:.0f} записей/с)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,8 +20,96 @@
 - Обрабатывайте разный регистр букв и лишние символы
 """
 
-from datetime import datetime
-from typing import List, Dict
+import heapq
+import re
+from datetime import datetime, timedelta
+from operator import itemgetter
+from typing import List, Dict, Iterable, Iterator, Tuple
+
+# Дата, которая считается "сегодня" (фиксирована для воспроизводимости тестов)
+reference_date = datetime(2026, 2, 11, 15, 30)
+
+month_numbers = {'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4, 'мая': 5, 'июня': 6,
+                 'июля': 7, 'августа': 8, 'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12}
+# Месяц определяется по первым трём буквам: 'фев', 'февраля', 'ФЕВ.' → 2
+month_stems = {name[:3]: number for name, number in month_numbers.items()}
+month_stems['май'] = 5
+
+relative_days = {'сегодня': 0, 'вчера': 1}
+last_month_marker = 'в прошлом месяце'
+
+time_suffix = r'(?:,\s*(?P<hour>\d{1,2}):(?P<minute>\d{2}))?$'
+relative_pattern = re.compile(r'^(?P<word>[а-яё]+)' + time_suffix)
+text_date_pattern = re.compile(
+    r'^(?P<day>\d{1,2})\s+(?P<month>[а-яё]+)\.?(?:\s+(?P<year>\d{4}))?(?:\s*г\.?)?' + time_suffix)
+numeric_date_pattern = re.compile(r'^(?P<day>\d{1,2})\.(?P<month>\d{1,2})\.(?P<year>\d{4})' + time_suffix)
+
+
+def _normalize(time_str: str) -> str:
+    """Приводит строку к нижнему регистру и отрезает хвост после '•'"""
+    cleaned = time_str.split('•', 1)[0].lower()
+    return re.sub(r'\s+', ' ', cleaned).strip()
+
+
+def _with_time(day: datetime, match: re.Match) -> datetime:
+    """Подставляет время из совпадения (если оно есть) в дату"""
+    if match.group('hour') is None:
+        return day
+    return day.replace(hour=int(match.group('hour')), minute=int(match.group('minute')))
+
+
+def parse_transaction_time(time_str: str, now: datetime = reference_date) -> datetime:
+    """
+    Преобразует строку времени транзакции в datetime.
+
+    Args:
+        time_str: Строка времени в одном из поддерживаемых форматов
+        now: Дата, которая считается "сегодня"
+
+    Returns:
+        Момент проведения транзакции
+
+    Raises:
+        ValueError: если формат строки не распознан
+    """
+    text = _normalize(time_str)
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    if text == last_month_marker:
+        return (midnight.replace(day=1) - timedelta(days=1)).replace(day=1)
+
+    match = relative_pattern.match(text)
+    if match and match.group('word') in relative_days:
+        return _with_time(midnight - timedelta(days=relative_days[match.group('word')]), match)
+
+    match = text_date_pattern.match(text)
+    if match and match.group('month')[:3] in month_stems:
+        year = int(match.group('year') or now.year)
+        day = datetime(year, month_stems[match.group('month')[:3]], int(match.group('day')))
+        return _with_time(day, match)
+
+    match = numeric_date_pattern.match(text)
+    if match:
+        day = datetime(int(match.group('year')), int(match.group('month')), int(match.group('day')))
+        return _with_time(day, match)
+
+    raise ValueError(f"Неизвестный формат времени: {time_str!r}")
+
+
+def transaction_sort_key(transaction: Dict[str, str], now: datetime = reference_date) -> datetime:
+    """
+    Ключ сортировки транзакции: момент её проведения.
+
+    Транзакции с нераспознанным или отсутствующим временем получают datetime.min
+    и оказываются в конце списка, а не прерывают сортировку.
+    """
+    time_str = transaction.get('time') if isinstance(transaction, dict) else None
+    if not isinstance(time_str, str):
+        return datetime.min
+    try:
+        return parse_transaction_time(time_str, now)
+    except ValueError:
+        return datetime.min
 
 
 def sort_transactions(transactions: List[Dict[str, str]]) -> List[str]:
@@ -34,8 +122,59 @@ def sort_transactions(transactions: List[Dict[str, str]]) -> List[str]:
     Returns:
         Список названий операций, отсортированный от новых к старым
     """
-    # ВАШ КОД ЗДЕСЬ
-    # 1. Распарсите каждую строку времени в объект datetime
-    # 2. Отсортируйте транзакции по дате (новые → старые)
-    # 3. Верните только названия операций
-    raise NotImplementedError("Реализуйте функцию sort_transactions")
\ No newline at end of file
+    ordered = sorted(transactions, key=transaction_sort_key, reverse=True)
+    return [item['operation'] for item in ordered]
+
+
+def _keyed_feed(feed_number: int, feed: Iterable[Dict[str, str]], now: datetime, check_order: bool,
+                unparsed: List[Dict[str, str]]) -> Iterator[Tuple[datetime, Dict[str, str]]]:
+    """Разбирает время транзакций источника по мере их запроса, откладывая нераспознанные в unparsed"""
+    previous = None
+    for transaction in feed:
+        moment = transaction_sort_key(transaction, now)
+        if moment == datetime.min:
+            unparsed.append(transaction)
+            continue
+        if check_order and previous is not None and moment > previous:
+            raise ValueError(f"Источник {feed_number} нарушает порядок от новых к старым: "
+                             f"{transaction.get('time')!r} ({moment}) идёт после {previous}")
+        previous = moment
+        yield moment, transaction
+
+
+def merge_sorted_transactions(*feeds: Iterable[Dict[str, str]], now: datetime = reference_date,
+                              check_order: bool = False) -> Iterator[Dict[str, str]]:
+    """
+    Лениво сливает уже отсортированные (от новых к старым) источники транзакций.
+
+    Время каждой транзакции разбирается только когда она становится первой
+    в своём источнике, поэтому слияние k источников из n транзакций стоит
+    O(n log k) и не требует загрузки всех данных в память. Транзакции с
+    одинаковым временем выдаются в порядке перечисления источников.
+
+    Транзакции с нераспознанным временем не участвуют ни в слиянии, ни в
+    проверке порядка: как и в sort_transactions, они выдаются в самом конце,
+    по порядку источников.
+
+    Args:
+        feeds: Источники транзакций, каждый отсортирован от новых к старым
+        now: Дата, которая считается "сегодня"
+        check_order: Проверять порядок внутри каждого источника
+
+    Returns:
+        Итератор транзакций от новых к старым
+
+    Raises:
+        ValueError: если check_order включён и источник нарушает порядок. Слияние
+            ленивое, поэтому ошибка возникает, только когда нарушающая порядок
+            транзакция становится первой в своём источнике: выданные до этого
+            транзакции уже могут идти в неверном порядке, и при ошибке вызывающий
+            код должен отбросить весь частичный результат.
+    """
+    unparsed = [[] for _ in feeds]
+    keyed_feeds = [_keyed_feed(number, feed, now, check_order, unparsed[number - 1])
+                   for number, feed in enumerate(feeds, start=1)]
+    for _, transaction in heapq.merge(*keyed_feeds, key=itemgetter(0), reverse=True):
+        yield transaction
+    for transactions in unparsed:
+        yield from transactions
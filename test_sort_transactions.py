@@ -0,0 +1,243 @@
+import io
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+import sort_cli
+from task import (merge_sorted_transactions, parse_transaction_time, reference_date, sort_transactions,
+                  transaction_sort_key)
+
+
+@pytest.mark.parametrize("time_str, expected", [
+    ('22 фев 2022, 9:12', datetime(2022, 2, 22, 9, 12)),
+    ('05 января, 12:34', datetime(2026, 1, 5, 12, 34)),
+    ('12 апреля 2024 г.', datetime(2024, 4, 12)),
+    ('15 МаРтА, 14:30', datetime(2026, 3, 15, 14, 30)),
+    ('07.05.2026, 10:15 • SMS • PUSH', datetime(2026, 5, 7, 10, 15)),
+    ('Сегодня, 16:05 • PUSH', datetime(2026, 2, 11, 16, 5)),
+    ('СЕГОДНЯ', datetime(2026, 2, 11)),
+    ('вЧеРа', datetime(2026, 2, 10)),
+    ('ВЧЕРА, 23:59', datetime(2026, 2, 10, 23, 59)),
+    ('В ПРОШЛОМ МЕСЯЦЕ', datetime(2026, 1, 1)),
+])
+def test_parse_transaction_time_formats(time_str, expected):
+    assert parse_transaction_time(time_str) == expected
+
+
+def test_parse_transaction_time_now_override():
+    now = datetime(2025, 1, 20, 8, 0)
+    assert parse_transaction_time('СЕГОДНЯ', now) == datetime(2025, 1, 20)
+    assert parse_transaction_time('вчера, 7:30', now) == datetime(2025, 1, 19, 7, 30)
+    assert parse_transaction_time('В ПРОШЛОМ МЕСЯЦЕ', now) == datetime(2024, 12, 1)
+    assert parse_transaction_time('05 мая', now) == datetime(2025, 5, 5)
+
+
+def test_parse_transaction_time_unknown_format():
+    with pytest.raises(ValueError):
+        parse_transaction_time('позавчера')
+
+
+@pytest.mark.parametrize("transaction", [
+    {"operation": "a", "time": "позавчера"},
+    {"operation": "a", "time": 7},
+    {"operation": "a", "time": None},
+    {"operation": "a"},
+])
+def test_transaction_sort_key_unparseable(transaction):
+    assert transaction_sort_key(transaction) == datetime.min
+
+
+TIED = [
+    {"operation": "old", "time": "22 фев 2022, 9:12"},
+    {"operation": "first", "time": "СЕГОДНЯ"},
+    {"operation": "second", "time": "сегодня, 0:00"},
+    {"operation": "third", "time": "Сегодня"},
+]
+
+
+def test_sort_records_keeps_ties_in_input_order():
+    assert [r["operation"] for r in sort_cli.sort_records(TIED)] == ["first", "second", "third", "old"]
+
+
+def test_sort_records_top_keeps_ties_in_input_order():
+    assert [r["operation"] for r in sort_cli.sort_records(TIED, top=2)] == ["first", "second"]
+
+
+def test_sort_records_now_override():
+    records = [{"operation": "yesterday", "time": "ВЧЕРА"}, {"operation": "dated", "time": "01 июня 2025"}]
+    now = datetime(2025, 6, 1, 12, 0)
+    assert [r["operation"] for r in sort_cli.sort_records(records, now)] == ["dated", "yesterday"]
+
+
+def _write_jsonl(path, records):
+    path.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records), encoding="utf-8")
+    return str(path)
+
+
+def test_main_jsonl(tmp_path, capsys):
+    path = _write_jsonl(tmp_path / "feed.jsonl", TIED)
+    assert sort_cli.main([path]) == 0
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == ["first", "second", "third", "old"]
+    assert "4 записей" in captured.err
+
+
+def test_main_jsonl_records_top_and_current_date(tmp_path, capsys):
+    path = _write_jsonl(tmp_path / "feed.jsonl", TIED)
+    assert sort_cli.main([path, "--top", "1", "--output-format", "jsonl", "--current-date", "2021-01-01"]) == 0
+    assert [json.loads(line) for line in capsys.readouterr().out.splitlines()] == [TIED[0]]
+
+
+def test_main_csv(tmp_path, capsys):
+    path = tmp_path / "feed.csv"
+    path.write_text('operation,time\nold,"22 фев 2022, 9:12"\nnew,СЕГОДНЯ\n', encoding="utf-8")
+    assert sort_cli.main([str(path), "--output-format", "csv"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["operation,time", "new,СЕГОДНЯ", 'old,"22 фев 2022, 9:12"']
+
+
+def test_main_stdin(monkeypatch, capsys):
+    data = '{"operation": "a", "time": "ВЧЕРА"}\n{"operation": "b", "time": "СЕГОДНЯ"}\n'
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data.encode("utf-8"))))
+    assert sort_cli.main([]) == 0
+    assert capsys.readouterr().out.splitlines() == ["b", "a"]
+
+
+@pytest.mark.parametrize("content, message", [
+    ('{"operation": "a", "time": "ВЧЕРА"}\nне json\n', "строка 2: некорректный JSON"),
+    ('[1, 2]\n', "строка 1: ожидался объект"),
+    ('{"time": "ВЧЕРА"}\n', "строка 1: нет полей: operation"),
+])
+def test_main_bad_jsonl(tmp_path, capsys, content, message):
+    path = tmp_path / "bad.jsonl"
+    path.write_text(content, encoding="utf-8")
+    assert sort_cli.main([str(path)]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert message in captured.err
+
+
+def test_main_csv_missing_columns(tmp_path, capsys):
+    path = tmp_path / "bad.csv"
+    path.write_text("name,time\na,СЕГОДНЯ\n", encoding="utf-8")
+    assert sort_cli.main([str(path)]) == 1
+    assert "нет столбцов: operation" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("content, line_no", [
+    ("operation,time,extra\na,ВЧЕРА,1\nb,СЕГОДНЯ,1,2\n", 3),
+    ("operation,time,extra\na,ВЧЕРА\n", 2),
+])
+def test_main_csv_ragged_rows(tmp_path, capsys, content, line_no):
+    path = tmp_path / "ragged.csv"
+    path.write_text(content, encoding="utf-8")
+    assert sort_cli.main([str(path), "--output-format", "jsonl"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert f"строка {line_no}: число ячеек не совпадает с заголовком" in captured.err
+
+
+def test_main_rejects_non_positive_top(tmp_path, capsys):
+    path = _write_jsonl(tmp_path / "feed.jsonl", TIED)
+    with pytest.raises(SystemExit) as excinfo:
+        sort_cli.main([path, "--top", "0"])
+    assert excinfo.value.code == 2
+    assert "--top должен быть положительным" in capsys.readouterr().err
+
+
+class _ClosedPipe(io.BytesIO):
+    def write(self, data):
+        raise BrokenPipeError(32, "Broken pipe")
+
+
+class _BrokenStdout:
+    def __init__(self, fd):
+        self.buffer = _ClosedPipe()
+        self._fd = fd
+
+    def fileno(self):
+        return self._fd
+
+
+def test_main_broken_pipe_exits_quietly(tmp_path, monkeypatch, capsys):
+    path = _write_jsonl(tmp_path / "feed.jsonl", TIED)
+    # main перенаправляет stdout.fileno() в devnull, поэтому подставляется дескриптор временного файла
+    fd = os.open(tmp_path / "stdout", os.O_WRONLY | os.O_CREAT)
+    monkeypatch.setattr(sys, "stdout", _BrokenStdout(fd))
+    try:
+        assert sort_cli.main([path]) == 0
+    finally:
+        os.close(fd)
+    assert capsys.readouterr().err == ""
+
+
+def test_main_missing_file(tmp_path, capsys):
+    assert sort_cli.main([str(tmp_path / "missing.jsonl")]) == 1
+    assert "sort_cli: ошибка" in capsys.readouterr().err
+
+
+def test_default_current_date():
+    assert sort_cli._parse_args([]).current_date == reference_date
+
+
+@pytest.mark.parametrize("value", ["2026-02-11T15:30+03:00", "11.02.2026"])
+def test_current_date_rejects_offset_and_bad_format(capsys, value):
+    with pytest.raises(SystemExit) as excinfo:
+        sort_cli.main(["--current-date", value])
+    assert excinfo.value.code == 2
+    assert "--current-date" in capsys.readouterr().err
+
+
+def _operations(transactions):
+    return [t["operation"] for t in transactions]
+
+
+def test_merge_sorted_transactions_matches_full_sort():
+    feed_a = [{"operation": "a1", "time": "Сегодня, 16:05"}, {"operation": "a2", "time": "05 января, 12:34"}]
+    feed_b = [{"operation": "b1", "time": "ВЧЕРА"}, {"operation": "b2", "time": "22 фев 2022, 9:12"}]
+    merged = merge_sorted_transactions(feed_a, feed_b, check_order=True)
+    assert _operations(merged) == sort_transactions(feed_a + feed_b) == ["a1", "b1", "a2", "b2"]
+
+
+def test_merge_sorted_transactions_equal_times_follow_feed_order():
+    feed_a = [{"operation": "a", "time": "СЕГОДНЯ"}]
+    feed_b = [{"operation": "b", "time": "сегодня, 0:00"}]
+    feed_c = [{"operation": "c", "time": "Сегодня"}]
+    assert _operations(merge_sorted_transactions(feed_c, feed_a, feed_b)) == ["c", "a", "b"]
+
+
+def test_merge_sorted_transactions_pulls_lazily():
+    pulled = []
+
+    def feed(name, times):
+        for time_str in times:
+            pulled.append(name)
+            yield {"operation": name, "time": time_str}
+
+    merged = merge_sorted_transactions(feed("a", ["СЕГОДНЯ", "ВЧЕРА"]), feed("b", ["ВЧЕРА", "В ПРОШЛОМ МЕСЯЦЕ"]))
+    assert pulled == []
+    assert next(merged)["operation"] == "a"
+    assert pulled == ["a", "b"]
+
+
+def test_merge_sorted_transactions_now_override():
+    feed_a = [{"operation": "today", "time": "СЕГОДНЯ"}]
+    feed_b = [{"operation": "dated", "time": "01 июня 2025"}]
+    merged = merge_sorted_transactions(feed_a, feed_b, now=datetime(2025, 5, 1))
+    assert _operations(merged) == ["dated", "today"]
+
+
+def test_merge_sorted_transactions_check_order():
+    feed = [{"operation": "old", "time": "ВЧЕРА"}, {"operation": "new", "time": "СЕГОДНЯ"}]
+    assert _operations(merge_sorted_transactions(feed)) == ["old", "new"]
+    with pytest.raises(ValueError, match="Источник 2 нарушает порядок"):
+        list(merge_sorted_transactions([], feed, check_order=True))
+
+
+def test_merge_sorted_transactions_unparseable_rows_go_last():
+    feed_a = [{"operation": "garbage_a", "time": "мусор"}, {"operation": "a", "time": "ВЧЕРА"}]
+    feed_b = [{"operation": "b", "time": "СЕГОДНЯ"}, {"operation": "garbage_b", "time": 7}]
+    merged = _operations(merge_sorted_transactions(feed_a, feed_b, check_order=True))
+    assert merged == sort_transactions(feed_a + feed_b) == ["b", "a", "garbage_a", "garbage_b"]